@@ -0,0 +1,63 @@
+"""
+Benchmark PDF render time for resumes from 1 to 20 pages.
+
+Run from the backend directory:
+    python -m benchmarks.pdf_render
+"""
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from services.pdf_service import save_resume_pdf
+
+ITEMS_PER_STEP = 10
+MAX_PAGES = 20
+
+
+def _resume(n_items: int) -> dict:
+    projects = ["Selected Publications and Projects"]
+    projects += [
+        f"- Project {i}: built a data pipeline processing {i * 1000} records with "
+        f"Python, FastAPI and PostgreSQL, cutting report latency by {i % 50 + 5}%."
+        for i in range(n_items)
+    ]
+    return {
+        "name": "Jane Doe",
+        "email": "jane@example.com",
+        "phone": "5551234567",
+        "linkedin": "linkedin.com/in/janedoe",
+        "summary": "Researcher with a long publication record.",
+        "skills": ["Python", "Machine Learning", "Distributed Systems"],
+        "education": "PhD Computer Science, Example University",
+        "projects": "\n".join(projects),
+    }
+
+
+def _page_count(path: str) -> int:
+    return len(re.findall(rb"/Type /Page\b(?!s)", Path(path).read_bytes()))
+
+
+def main() -> int:
+    seen = set()
+    with tempfile.TemporaryDirectory() as tmp:
+        out = str(Path(tmp) / "bench.pdf")
+        print(f"{'pages':>5} {'items':>6} {'seconds':>8} {'ms/page':>8}")
+        n_items = 0
+        while True:
+            start = time.perf_counter()
+            save_resume_pdf(_resume(n_items), out)
+            elapsed = time.perf_counter() - start
+            pages = _page_count(out)
+            if pages > MAX_PAGES:
+                break
+            if pages not in seen:
+                seen.add(pages)
+                print(f"{pages:>5} {n_items:>6} {elapsed:>8.3f} {elapsed * 1000 / pages:>8.1f}")
+            n_items += ITEMS_PER_STEP
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+"""
+Offline bulk resume generation.
+
+Reads UserInput records from a JSONL or CSV file, runs the LLM stage with
+async concurrency and renders PDF/DOCX files across all cores.
+
+Run from the backend directory:
+    python bulk_generate.py users.jsonl --out-dir out
+    python bulk_generate.py users.csv --zip resumes.zip --no-llm
+    python bulk_generate.py users.jsonl --out-dir out --cache-dir llm_cache --checkpoint done.txt
+
+With --zip, output is written as numbered parts (resumes-00001.zip, ...) of
+--zip-chunk resumes each. Record ids are only checkpointed once their part has
+been closed, so a killed run loses at most the part it was writing; rerunning
+with the same --checkpoint regenerates those records into a new part.
+"""
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Set, Tuple
+from models.user_input import UserInput
+from services.llm_service import (
+    OPENROUTER_API_KEY,
+    _clean_resume_text,
+    _local_fallback_text,
+    generate_resume_text,
+)
+from services.pdf_service import save_resume_pdf
+from services.docx_service import save_resume_docx
+
+LIST_FIELDS = ("skills", "languages")
+
+
+def _read_records(path: Path) -> Iterator[Tuple[str, Optional[dict], Optional[str]]]:
+    """
+    Yield (record id, raw record, error) triples, using the "id" field when
+    present. Unreadable records come back with record None and an error.
+    """
+    # utf-8-sig strips the BOM Excel puts in front of the CSV header
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        if path.suffix.lower() == ".csv":
+            for n, row in enumerate(csv.DictReader(f), 1):
+                record = {k: (v if v != "" else None) for k, v in row.items()}
+                for key in LIST_FIELDS:
+                    if record.get(key):
+                        record[key] = [part.strip() for part in record[key].split(",") if part.strip()]
+                yield str(record.pop("id", None) or n), record, None
+        else:
+            for n, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield str(n), None, f"invalid JSON on line {n}: {e}"
+                    continue
+                if not isinstance(record, dict):
+                    yield str(n), None, f"line {n} is not a JSON object"
+                    continue
+                yield str(record.pop("id", None) or n), record, None
+
+
+def _safe_name(record_id: str) -> str:
+    name = re.sub(r"[^A-Za-z0-9_.-]", "_", record_id)
+    if name != record_id:
+        # Keep ids like "a/b" and "a_b" from writing the same file
+        name += "-" + hashlib.sha256(record_id.encode()).hexdigest()[:8]
+    return name
+
+
+def _load_checkpoint(path: Optional[Path]) -> Set[str]:
+    if not path or not path.exists():
+        return set()
+    return {line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()}
+
+
+def _render(record_id: str, structured_data: dict, out_dir: str) -> Tuple[str, str]:
+    # Runs in a worker process
+    name = _safe_name(record_id)
+    pdf_path = save_resume_pdf(structured_data, str(Path(out_dir) / f"{name}.pdf"))
+    docx_path = save_resume_docx(structured_data, str(Path(out_dir) / f"{name}.docx"))
+    return pdf_path, docx_path
+
+
+async def _resume_text(data: UserInput, use_llm: bool, cache_dir: Optional[Path]) -> str:
+    if not use_llm:
+        return _clean_resume_text(_local_fallback_text(data))
+
+    cache_file = None
+    if cache_dir:
+        key = hashlib.sha256(data.model_dump_json().encode()).hexdigest()
+        cache_file = cache_dir / f"{key}.json"
+        try:
+            return json.loads(cache_file.read_text(encoding="utf-8"))["resume_text"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # missing or unreadable entries count as a cache miss
+
+    result = await generate_resume_text(data)
+    if result.get("fallback"):
+        # Never cache or checkpoint fallback text as if the LLM had produced it
+        raise RuntimeError("LLM request failed, local fallback text not used in LLM mode")
+    if cache_file:
+        # Write then rename so a killed run never leaves a truncated entry behind
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+            json.dump(result, tmp)
+        os.replace(tmp_path, cache_file)
+    return result["resume_text"]
+
+
+class _Checkpoint:
+    def __init__(self, path: Optional[Path]):
+        self.done = _load_checkpoint(path)
+        self._file = path.open("a", encoding="utf-8") if path else None
+
+    def commit(self, record_ids: List[str]) -> None:
+        if self._file and record_ids:
+            self._file.write("".join(record_id + "\n" for record_id in record_ids))
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+
+
+class _ZipParts:
+    """
+    Streams rendered files into numbered zip parts. A part's record ids are
+    committed to the checkpoint only after the part is closed and readable.
+    """
+
+    def __init__(self, base: Path, chunk_size: int, checkpoint: _Checkpoint):
+        self.base = base
+        self.chunk_size = chunk_size
+        self.checkpoint = checkpoint
+        self.base.parent.mkdir(parents=True, exist_ok=True)
+        self._index = 0
+        self._archive: Optional[zipfile.ZipFile] = None
+        self._pending: List[str] = []
+
+    def _next_path(self) -> Path:
+        while True:
+            self._index += 1
+            path = self.base.with_name(f"{self.base.stem}-{self._index:05d}{self.base.suffix}")
+            if not path.exists():
+                return path
+
+    def add(self, record_id: str, paths: Tuple[str, ...]) -> None:
+        # Runs on a single archive thread, which keeps parts and checkpoint in order
+        if self._archive is None:
+            # PDF and DOCX are already compressed, deflating them again only costs time
+            self._archive = zipfile.ZipFile(self._next_path(), "w", zipfile.ZIP_STORED)
+        for path in paths:
+            self._archive.write(path, arcname=Path(path).name)
+            os.remove(path)
+        self._pending.append(record_id)
+        if len(self._pending) >= self.chunk_size:
+            self.close()
+
+    def close(self) -> None:
+        if self._archive is None:
+            return
+        self._archive.close()
+        self._archive = None
+        self.checkpoint.commit(self._pending)
+        self._pending = []
+
+
+async def run(args: argparse.Namespace) -> int:
+    checkpoint = _Checkpoint(Path(args.checkpoint) if args.checkpoint else None)
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    if cache_dir:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Zip output renders into a scratch directory and streams files into the archive
+    render_dir = Path(tempfile.mkdtemp()) if args.zip else Path(args.out_dir)
+    render_dir.mkdir(parents=True, exist_ok=True)
+    zip_parts = _ZipParts(Path(args.zip), args.zip_chunk, checkpoint) if args.zip else None
+    archive_thread = ThreadPoolExecutor(max_workers=1) if args.zip else None
+
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    # One consumer per LLM slot and render worker keeps both stages busy
+    n_consumers = args.concurrency + args.workers
+    queue: asyncio.Queue = asyncio.Queue(maxsize=n_consumers * 2)
+    stats = {"done": 0, "failed": 0, "skipped": 0}
+    started = time.perf_counter()
+
+    def fail(record_id: str, reason) -> None:
+        stats["failed"] += 1
+        print(f"[{record_id}] failed: {reason}", file=sys.stderr)
+
+    async def process(pool: ProcessPoolExecutor, record_id: str, record: dict) -> None:
+        try:
+            data = UserInput(**record)
+            async with semaphore:
+                resume_text = await _resume_text(data, not args.no_llm, cache_dir)
+            paths = await loop.run_in_executor(
+                pool, _render, record_id, data.to_resume_dict(resume_text), str(render_dir)
+            )
+            if zip_parts:
+                await loop.run_in_executor(archive_thread, zip_parts.add, record_id, paths)
+            else:
+                checkpoint.commit([record_id])
+        except Exception as e:
+            fail(record_id, e)
+            return
+
+        stats["done"] += 1
+        if stats["done"] % args.progress_every == 0:
+            elapsed = time.perf_counter() - started
+            print(f"{stats['done']} resumes, {stats['done'] / elapsed:.1f}/s", file=sys.stderr)
+
+    async def consume(pool: ProcessPoolExecutor) -> None:
+        while True:
+            item = await queue.get()
+            try:
+                if item is None:
+                    return
+                await process(pool, *item)
+            finally:
+                queue.task_done()
+
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            consumers = [asyncio.create_task(consume(pool)) for _ in range(n_consumers)]
+            seen: Set[str] = set()
+            try:
+                for record_id, record, error in _read_records(Path(args.input)):
+                    if error:
+                        fail(record_id, error)
+                    elif record_id in seen:
+                        # Explicit ids can also collide with line-number ids
+                        fail(record_id, "duplicate record id")
+                    elif record_id in checkpoint.done:
+                        stats["skipped"] += 1
+                    else:
+                        await queue.put((record_id, record))
+                    if not error:
+                        seen.add(record_id)
+                for _ in consumers:
+                    await queue.put(None)
+                await asyncio.gather(*consumers)
+            finally:
+                for consumer in consumers:
+                    consumer.cancel()
+    finally:
+        if zip_parts:
+            archive_thread.shutdown(wait=True)
+            zip_parts.close()
+            shutil.rmtree(render_dir, ignore_errors=True)
+        checkpoint.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"Generated {stats['done']} resumes in {elapsed:.1f}s "
+        f"({stats['done'] / elapsed if elapsed else 0:.1f}/s), "
+        f"{stats['failed']} failed, {stats['skipped']} skipped from checkpoint"
+    )
+    return 1 if stats["failed"] else 0
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate resumes in bulk from a JSONL or CSV file.")
+    parser.add_argument("input", help="JSONL or CSV file of UserInput records")
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--out-dir", help="directory to write PDF and DOCX files to")
+    output.add_argument("--zip", help="base name for numbered zip parts to stream PDF and DOCX files into")
+    parser.add_argument("--zip-chunk", type=_positive_int, default=500, help="resumes per zip part")
+    parser.add_argument("--no-llm", action="store_true", help="skip the LLM and use the local fallback text")
+    parser.add_argument("--cache-dir", help="reuse and store LLM outputs in this directory")
+    parser.add_argument("--checkpoint", help="file of finished record ids, used to resume a run")
+    parser.add_argument("--concurrency", type=_positive_int, default=8, help="concurrent LLM requests")
+    parser.add_argument("--workers", type=_positive_int, default=os.cpu_count() or 1, help="render processes")
+    parser.add_argument("--progress-every", type=_positive_int, default=100,
+                        help="report throughput every N resumes")
+    args = parser.parse_args(argv)
+
+    if not args.no_llm and not args.cache_dir and not OPENROUTER_API_KEY:
+        parser.error("OPENROUTER_API_KEY is not set; pass --no-llm to use the local fallback text.")
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
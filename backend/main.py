@@ -1,11 +1,21 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from models.user_input import UserInput
 from services.llm_service import generate_resume_text
+from services.model_router import router
 from services.pdf_service import save_resume_pdf
 from services.docx_service import save_resume_docx
+from services.profiling_service import (
+    PROFILE_HEADER,
+    PROFILE_QUERY_PARAM,
+    PipelineProfile,
+    find_profile,
+    is_authorized,
+    is_enabled,
+)
+from contextlib import nullcontext
 from pathlib import Path
 import traceback
 import logging
@@ -36,49 +46,89 @@ async def root():
     index_file = frontend_dir / "index.html"
     return FileResponse(str(index_file))
 
+async def _run_pipeline(data: UserInput, profile: PipelineProfile = None) -> dict:
+    # Call LLM service
+    if profile:
+        result = await profile.timed("generate_resume_text", generate_resume_text(data))
+    else:
+        result = await generate_resume_text(data)
+    resume_text = result["resume_text"]
+    user_description = result["user_description"]
+
+    structured_data = data.to_resume_dict(resume_text)
+
+    # Save resume files
+    with profile.profiled("save_resume_pdf") if profile else nullcontext():
+        save_resume_pdf(structured_data)
+    with profile.profiled("save_resume_docx") if profile else nullcontext():
+        save_resume_docx(structured_data)
+
+    return {
+        "resume_text": resume_text,
+        "user_description": user_description,
+        "pdf_file": "/download/pdf",
+        "docx_file": "/download/docx"
+    }
+
+def _profile_token(request: Request):
+    return request.headers.get(PROFILE_HEADER) or request.query_params.get(PROFILE_QUERY_PARAM)
+
 @app.post("/generate")
-async def generate_resume(data: UserInput):
+async def generate_resume(data: UserInput, request: Request):
     """
-    Generate a professional resume using LLaMA.
+    Generate a professional resume with the model picked by the router from OPENROUTER_MODELS.
     Returns resume text, user description, and download links.
+    Send a valid profile token to profile the pipeline; the profile is saved
+    even when generation fails.
     """
-    try:
-        # Call LLM service
-        result = await generate_resume_text(data)
-        resume_text = result["resume_text"]
-        user_description = result["user_description"]
-
-        structured_data = {
-            "name": data.name,
-            "email": data.email,
-            "phone": data.phone,
-            "linkedin": data.linkedin,
-            "summary": data.summary,
-            "skills": data.skills,
-            "languages": getattr(data, "languages", None),
-            "experience": data.experience,
-            "education": data.education,
-            "projects": data.projects,
-            "certifications": data.certifications,
-            "extracurriculars": getattr(data, "extracurriculars", None),
-            "generated_text": resume_text,
-        }
-
-        # Save resume files
-        pdf_path = save_resume_pdf(structured_data)
-        docx_path = save_resume_docx(structured_data)
-
-        return JSONResponse({
-            "resume_text": resume_text,
-            "user_description": user_description,
-            "pdf_file": "/download/pdf",
-            "docx_file": "/download/docx"
-        })
+    profile = None
+    if is_enabled():
+        token = _profile_token(request)
+        if token is not None and not is_authorized(token):
+            raise HTTPException(status_code=403, detail="Invalid profile token.")
+        if token is not None:
+            profile = PipelineProfile()
 
+    try:
+        response = await _run_pipeline(data, profile)
+        status_code = 200
     except Exception as e:
         tb = traceback.format_exc()
         logger.error("Error in /generate: %s", tb)
-        return JSONResponse({"error": "Failed to generate resume", "detail": str(e), "trace": tb}, status_code=500)
+        response = {"error": "Failed to generate resume", "detail": str(e), "trace": tb}
+        status_code = 500
+
+    if profile:
+        try:
+            profile_id = profile.save()
+            response["profile_id"] = profile_id
+            response["profile_file"] = f"/debug/profiles/{profile_id}"
+        except Exception:
+            # A profile that cannot be written must not cost the user their resume
+            logger.error("Failed to save profile: %s", traceback.format_exc())
+    return JSONResponse(response, status_code=status_code)
+
+@app.get("/debug/profiles/{profile_id}")
+async def get_profile(profile_id: str, request: Request, format: str = "text"):
+    """
+    Return a saved profile as a text report, or the raw pstats dump with format=prof.
+    """
+    if not is_authorized(_profile_token(request)):
+        raise HTTPException(status_code=403, detail="Invalid profile token.")
+    raw = format == "prof"
+    profile_path = find_profile(profile_id, raw=raw)
+    if profile_path is None:
+        raise HTTPException(status_code=404, detail="Profile not found.")
+    if raw:
+        return FileResponse(str(profile_path), media_type="application/octet-stream", filename=profile_path.name)
+    return FileResponse(str(profile_path), media_type="text/plain")
+
+@app.get("/metrics/models")
+async def model_metrics():
+    """
+    Per-model latency and error-rate estimates plus routing decision counts.
+    """
+    return JSONResponse(router.snapshot())
 
 @app.get("/download/pdf")
 async def download_pdf():
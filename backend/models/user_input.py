@@ -14,3 +14,21 @@ class UserInput(BaseModel):
     projects: Optional[str] = None
     certifications: Optional[str] = None
     extracurriculars: Optional[str] = None
+
+    def to_resume_dict(self, generated_text: str) -> dict:
+        """Structured data consumed by the PDF and DOCX renderers."""
+        return {
+            "name": self.name,
+            "email": self.email,
+            "phone": self.phone,
+            "linkedin": self.linkedin,
+            "summary": self.summary,
+            "skills": self.skills,
+            "languages": self.languages,
+            "experience": self.experience,
+            "education": self.education,
+            "projects": self.projects,
+            "certifications": self.certifications,
+            "extracurriculars": self.extracurriculars,
+            "generated_text": generated_text,
+        }
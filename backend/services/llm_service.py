@@ -6,11 +6,17 @@ import difflib
 import textwrap
 import asyncio
 import random
+import time
+import logging
 from models.user_input import UserInput
+from services.model_router import OPENROUTER_MIN_TIER, router
 
 load_dotenv()
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+# Point at a local stand-in server to exercise routing without OpenRouter
+OPENROUTER_URL = os.getenv("OPENROUTER_URL", "https://openrouter.ai/api/v1/chat/completions")
+
+logger = logging.getLogger("uvicorn.error")
 
 
 def _clean_resume_text(text: str) -> str:
@@ -66,7 +72,7 @@ def _local_fallback_text(data: UserInput) -> str:
     return "\n\n".join(parts)
 
 
-async def generate_resume_text(data: UserInput) -> dict:
+async def generate_resume_text(data: UserInput, min_tier: int = OPENROUTER_MIN_TIER) -> dict:
     if not OPENROUTER_API_KEY:
         raise RuntimeError("OPENROUTER_API_KEY is not set. Please add it to your .env file.")
 
@@ -115,32 +121,43 @@ SHORT USER DESCRIPTION: <2–3 sentence summary of the person>
 """
 
     headers = {"Authorization": f"Bearer {OPENROUTER_API_KEY}", "Content-Type": "application/json"}
-    payload = {"model": "meta-llama/llama-3.1-8b-instruct",
-               "messages": [{"role": "system", "content": "You are an expert resume writer who outputs plain text only."},
+    payload = {"messages": [{"role": "system", "content": "You are an expert resume writer who outputs plain text only."},
                             {"role": "user", "content": prompt}],
                "max_tokens": 1600, "temperature": 0.2}
 
     max_attempts = 3
+    tried = ()
     async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, connect=15.0)) as client:
         for attempt in range(max_attempts):
+            model = router.choose(min_tier, exclude=tried)
+            if model in tried:
+                # Every eligible model already failed this request, back off before repeating one
+                await asyncio.sleep(1 * (2 ** (attempt - 1)) + random.random())
+            tried += (model,)
+            logger.info("Routing resume request to %s (attempt %d)", model, attempt + 1)
+            started = time.monotonic()
             try:
-                resp = await client.post(OPENROUTER_URL, headers=headers, json=payload)
+                resp = await client.post(OPENROUTER_URL, headers=headers, json={**payload, "model": model})
                 if resp.status_code in (408, 429) or 500 <= resp.status_code < 600:
-                    await asyncio.sleep(1 * (2 ** attempt) + random.random())
+                    router.record_failure(model)
                     continue
                 resp.raise_for_status()
                 result = resp.json()
                 output_text = result["choices"][0]["message"]["content"].strip()
+                router.record_success(model, time.monotonic() - started)
 
                 if "SHORT USER DESCRIPTION:" in output_text:
                     resume_text, user_desc = output_text.split("SHORT USER DESCRIPTION:", 1)
-                    return {"resume_text": _clean_resume_text(resume_text.strip()), "user_description": user_desc.strip()}
+                    return {"resume_text": _clean_resume_text(resume_text.strip()), "user_description": user_desc.strip(),
+                            "fallback": False}
                 else:
                     return {"resume_text": _clean_resume_text(output_text),
-                            "user_description": f"{data.name} is skilled in {', '.join(data.skills or [])}."}
+                            "user_description": f"{data.name} is skilled in {', '.join(data.skills or [])}.",
+                            "fallback": False}
             except Exception:
+                router.record_failure(model)
                 continue
 
     fb_resume = _clean_resume_text(_local_fallback_text(data))
     fb_desc = f"{data.name} is skilled in {', '.join(data.skills or [])}."
-    return {"resume_text": fb_resume, "user_description": fb_desc}
+    return {"resume_text": fb_resume, "user_description": fb_desc, "fallback": True}
@@ -0,0 +1,120 @@
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_MODELS = "meta-llama/llama-3.1-8b-instruct=1"
+# Comma separated "model=tier" pairs, higher tier means higher quality
+OPENROUTER_MODELS = os.getenv("OPENROUTER_MODELS", DEFAULT_MODELS)
+OPENROUTER_MIN_TIER = int(os.getenv("OPENROUTER_MIN_TIER", "1"))
+EWMA_ALPHA = float(os.getenv("ROUTER_EWMA_ALPHA", "0.2"))
+MAX_ERROR_RATE = float(os.getenv("ROUTER_MAX_ERROR_RATE", "0.5"))
+RETRY_UNHEALTHY_AFTER = float(os.getenv("ROUTER_RETRY_UNHEALTHY_AFTER", "30"))
+
+
+def parse_models(spec: str) -> List[Tuple[str, int]]:
+    models = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, tier = item.partition("=")
+        name = name.strip()
+        if any(name == seen for seen, _ in models):
+            raise ValueError(f"OPENROUTER_MODELS lists {name} more than once.")
+        models.append((name, int(tier) if tier.strip() else 1))
+    if not models:
+        raise ValueError("OPENROUTER_MODELS does not list any models.")
+    return models
+
+
+class ModelStats:
+    def __init__(self, name: str, tier: int):
+        self.name = name
+        self.tier = tier
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.routed = 0
+        self.last_failure = 0.0
+
+    def healthy(self, now: float) -> bool:
+        # Unhealthy models get another chance once the cooldown has passed
+        return self.error_rate < MAX_ERROR_RATE or now - self.last_failure >= RETRY_UNHEALTHY_AFTER
+
+    def to_dict(self) -> dict:
+        return {
+            "tier": self.tier,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "requests": self.requests,
+            "failures": self.failures,
+            "routed": self.routed,
+            "healthy": self.healthy(time.monotonic()),
+        }
+
+
+class ModelRouter:
+    """
+    Keeps a rolling (EWMA) latency and error-rate estimate per model and picks
+    the fastest healthy model that meets the required quality tier.
+    """
+
+    def __init__(self, models: List[Tuple[str, int]], min_tier: int = 1):
+        self.models: Dict[str, ModelStats] = {name: ModelStats(name, tier) for name, tier in models}
+        self.decisions: Dict[str, int] = {}
+        if not any(stats.tier >= min_tier for stats in self.models.values()):
+            raise ValueError(f"No configured model meets the minimum tier {min_tier}.")
+
+    def choose(self, min_tier: int = 1, exclude: Tuple[str, ...] = ()) -> str:
+        candidates = [m for m in self.models.values() if m.tier >= min_tier]
+        if not candidates:
+            raise ValueError(f"No configured model meets tier {min_tier}.")
+        fresh = [m for m in candidates if m.name not in exclude] or candidates
+
+        now = time.monotonic()
+        healthy = [m for m in fresh if m.healthy(now)]
+        if healthy:
+            # Untried models go first, models that never succeeded go last
+            chosen = min(healthy, key=lambda m: (
+                m.requests > 0, m.latency if m.latency is not None else float("inf")
+            ))
+            reason = "fastest_healthy"
+        else:
+            chosen = min(fresh, key=lambda m: m.error_rate)
+            reason = "least_failing"
+
+        if chosen.error_rate >= MAX_ERROR_RATE:
+            # Probing an unhealthy model restarts its cooldown so only one request probes it
+            chosen.last_failure = now
+        chosen.routed += 1
+        key = f"{chosen.name}:{reason}"
+        self.decisions[key] = self.decisions.get(key, 0) + 1
+        return chosen.name
+
+    def record_success(self, name: str, latency: float) -> None:
+        stats = self.models[name]
+        stats.requests += 1
+        stats.latency = latency if stats.latency is None else (
+            EWMA_ALPHA * latency + (1 - EWMA_ALPHA) * stats.latency
+        )
+        stats.error_rate *= 1 - EWMA_ALPHA
+
+    def record_failure(self, name: str) -> None:
+        stats = self.models[name]
+        stats.requests += 1
+        stats.failures += 1
+        stats.error_rate = EWMA_ALPHA + (1 - EWMA_ALPHA) * stats.error_rate
+        stats.last_failure = time.monotonic()
+
+    def snapshot(self) -> dict:
+        return {
+            "models": {name: stats.to_dict() for name, stats in self.models.items()},
+            "decisions": dict(self.decisions),
+        }
+
+
+router = ModelRouter(parse_models(OPENROUTER_MODELS), OPENROUTER_MIN_TIER)
@@ -1,5 +1,5 @@
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from reportlab.platypus import Flowable, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.lib import colors
@@ -83,6 +83,10 @@ PAGE_WIDTH, PAGE_HEIGHT = A4
 LEFT_MARGIN = RIGHT_MARGIN = 40
 TOP_MARGIN = BOTTOM_MARGIN = 30
 CONTENT_WIDTH = PAGE_WIDTH - LEFT_MARGIN - RIGHT_MARGIN
+BOX_H_PADDING = 8
+BOX_V_PADDING = 4
+BOX_LINE_WIDTH = 0.7
+BOX_COLOR = colors.HexColor("#333333")
 
 styles = getSampleStyleSheet()
 try:
@@ -155,26 +159,84 @@ def _p(text: str, style="Body"):
     return Paragraph(clean_text, styles[style])
 
 
+class _BoxedSection(Flowable):
+    """
+    Bordered column of flowables that splits between children (or inside a
+    too-tall paragraph) instead of being laid out as a single Table.
+    Child heights are cached so each page only measures what it places.
+    """
+
+    def __init__(self, flowables: List, box_width: float = CONTENT_WIDTH,
+                 heights: List[float] = None, keep_first: bool = False):
+        Flowable.__init__(self)
+        self._flowables = flowables
+        self._heights = heights
+        self._keep_first = keep_first
+        self.width = box_width
+
+    def _inner_width(self) -> float:
+        return self.width - 2 * BOX_H_PADDING
+
+    def _measure(self, flowable, availHeight: float) -> float:
+        return flowable.wrap(self._inner_width(), availHeight)[1]
+
+    def wrap(self, availWidth, availHeight):
+        if self._heights is None:
+            self._heights = [self._measure(f, availHeight) for f in self._flowables]
+        self.height = sum(self._heights) + 2 * BOX_V_PADDING * len(self._heights)
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        self.wrap(availWidth, availHeight)
+        used = 0
+        for i, height in enumerate(self._heights):
+            slot = height + 2 * BOX_V_PADDING
+            if used + slot <= availHeight:
+                used += slot
+                continue
+
+            head, head_heights = self._flowables[:i], self._heights[:i]
+            tail, tail_heights = self._flowables[i:], self._heights[i:]
+            parts = self._flowables[i].split(
+                self._inner_width(), availHeight - used - 2 * BOX_V_PADDING
+            )
+            if len(parts) > 1:
+                head = head + parts[:1]
+                head_heights = head_heights + [self._measure(parts[0], availHeight)]
+                tail = parts[1:] + self._flowables[i + 1:]
+                tail_heights = [self._measure(p, availHeight) for p in parts[1:]] + self._heights[i + 1:]
+            else:
+                # A failed split discards the child's layout, so wrap it again
+                self._measure(self._flowables[i], availHeight)
+
+            # Never leave a section title alone at the bottom of a page
+            if len(head) <= (1 if self._keep_first else 0):
+                return []
+            return [
+                _BoxedSection(head, self.width, head_heights, self._keep_first),
+                _BoxedSection(tail, self.width, tail_heights),
+            ]
+        return [self]
+
+    def draw(self):
+        y = self.height
+        for flowable, height in zip(self._flowables, self._heights):
+            y -= BOX_V_PADDING + height
+            flowable.drawOn(self.canv, BOX_H_PADDING, y)
+            y -= BOX_V_PADDING
+        self.canv.saveState()
+        self.canv.setStrokeColor(BOX_COLOR)
+        self.canv.setLineWidth(BOX_LINE_WIDTH)
+        self.canv.rect(0, 0, self.width, self.height)
+        self.canv.restoreState()
+
+
 def _boxed_section(title: str, flowables: List, box_width: float = CONTENT_WIDTH):
     elems = []
     if title:
         elems.append(Paragraph(title.upper(), styles["SectionTitle"]))
     elems.extend(flowables)
-    rows = [[e] for e in elems]
-    tbl = Table(rows, colWidths=[box_width])
-    tbl.setStyle(
-        TableStyle(
-            [
-                ("BOX", (0, 0), (-1, -1), 0.7, colors.HexColor("#333333")),
-                ("LEFTPADDING", (0, 0), (-1, -1), 8),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-                ("TOPPADDING", (0, 0), (-1, -1), 4),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ]
-        )
-    )
-    return tbl
+    return _BoxedSection(elems, box_width, keep_first=bool(title))
 
 
 def _contact_link(url: str, display_text: str):
@@ -0,0 +1,102 @@
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import re
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Awaitable, Dict, Optional, TypeVar
+from dotenv import load_dotenv
+
+load_dotenv()
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+# Profiling stays disabled unless a token is configured
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN")
+PROFILES_DIR = Path(os.getenv("PROFILES_DIR", str(BASE_DIR / "profiles")))
+MAX_PROFILES = int(os.getenv("MAX_PROFILES", "20"))
+PROFILE_HEADER = "X-Profile-Token"
+PROFILE_QUERY_PARAM = "profile_token"
+REPORT_LINES = 60
+
+_PROFILE_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+T = TypeVar("T")
+
+
+def is_enabled() -> bool:
+    return bool(PROFILE_TOKEN)
+
+
+def is_authorized(token: Optional[str]) -> bool:
+    if not PROFILE_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode(), PROFILE_TOKEN.encode())
+
+
+def _prune_profiles() -> None:
+    profiles = sorted(PROFILES_DIR.glob("*.prof"), key=lambda p: p.stat().st_mtime)
+    for old in profiles[:max(len(profiles) - MAX_PROFILES, 0)]:
+        old.unlink(missing_ok=True)
+        old.with_suffix(".txt").unlink(missing_ok=True)
+
+
+class PipelineProfile:
+    """
+    Per-request profile. Synchronous stages run under cProfile, awaited stages
+    (the LLM call) are only timed, so other requests that run on the event
+    loop while this one waits never end up in the profile.
+    """
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.spans: Dict[str, float] = {}
+        self._has_stats = False
+
+    async def timed(self, name: str, awaitable: Awaitable[T]) -> T:
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.spans[name] = time.perf_counter() - started
+
+    @contextmanager
+    def profiled(self, name: str):
+        # Must not await inside this block, cProfile covers the whole thread
+        started = time.perf_counter()
+        self.profiler.enable()
+        try:
+            yield
+        finally:
+            self.profiler.disable()
+            self._has_stats = True
+            self.spans[name] = time.perf_counter() - started
+
+    def save(self) -> str:
+        PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+        profile_id = uuid.uuid4().hex
+        prof_path = PROFILES_DIR / f"{profile_id}.prof"
+        self.profiler.dump_stats(str(prof_path))
+
+        report = io.StringIO()
+        report.write("Stage timings (wall clock):\n")
+        for name, seconds in self.spans.items():
+            report.write(f"  {name:<24} {seconds * 1000:10.1f} ms\n")
+        report.write("\n")
+        if self._has_stats:
+            stats = pstats.Stats(self.profiler, stream=report)
+            stats.sort_stats("cumulative").print_stats(REPORT_LINES)
+        prof_path.with_suffix(".txt").write_text(report.getvalue(), encoding="utf-8")
+
+        _prune_profiles()
+        return profile_id
+
+
+def find_profile(profile_id: str, raw: bool = False) -> Optional[Path]:
+    if not _PROFILE_ID_RE.match(profile_id):
+        return None
+    path = PROFILES_DIR / f"{profile_id}.{'prof' if raw else 'txt'}"
+    return path if path.exists() else None
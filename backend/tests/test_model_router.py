@@ -0,0 +1,126 @@
+import asyncio
+import json
+import httpx
+import pytest
+import services.llm_service as llm_service
+import services.model_router as model_router
+from models.user_input import UserInput
+from services.model_router import MAX_ERROR_RATE, RETRY_UNHEALTHY_AFTER, ModelRouter, parse_models
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(model_router.time, "monotonic", fake)
+    return fake
+
+
+def _make_unhealthy(router, name):
+    while router.models[name].error_rate < MAX_ERROR_RATE:
+        router.record_failure(name)
+
+
+def test_parse_models_rejects_duplicates():
+    assert parse_models("a=1, b=2, c") == [("a", 1), ("b", 2), ("c", 1)]
+    with pytest.raises(ValueError):
+        parse_models("a=1,b=2,a=3")
+
+
+def test_tier_filtering():
+    router = ModelRouter([("small", 1), ("large", 2)])
+    assert router.choose(min_tier=2) == "large"
+    with pytest.raises(ValueError):
+        router.choose(min_tier=3)
+    with pytest.raises(ValueError):
+        ModelRouter([("small", 1)], min_tier=2)
+
+
+def test_untried_models_go_first():
+    router = ModelRouter([("a", 1), ("b", 1)])
+    router.record_success("a", 0.01)
+    assert router.choose() == "b"
+
+
+def test_fastest_by_ewma_latency():
+    router = ModelRouter([("a", 1), ("b", 1)])
+    router.record_success("a", 1.0)
+    router.record_success("b", 0.1)
+    assert router.choose() == "b"
+    for _ in range(10):
+        router.record_success("b", 5.0)
+    assert router.choose() == "a"
+
+
+def test_unhealthy_model_gets_a_single_probe_after_cooldown(clock):
+    router = ModelRouter([("flaky", 1), ("slow", 1)])
+    router.record_success("flaky", 0.1)
+    router.record_success("slow", 1.0)
+    _make_unhealthy(router, "flaky")
+    assert router.choose() == "slow"
+
+    clock.now += RETRY_UNHEALTHY_AFTER
+    assert [router.choose() for _ in range(3)] == ["flaky", "slow", "slow"]
+
+    router.record_success("flaky", 0.1)
+    assert router.choose() == "flaky"
+
+
+def _run_generate(monkeypatch, models, min_tier, handler):
+    router = ModelRouter(models)
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(llm_service, "router", router)
+    monkeypatch.setattr(llm_service, "OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(llm_service.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(
+        llm_service.httpx, "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    data = UserInput(name="Jane", email="jane@example.com", phone="123")
+    result = asyncio.run(llm_service.generate_resume_text(data, min_tier=min_tier))
+    return result, router, sleeps
+
+
+def _handler(calls):
+    def handle(request):
+        model = json.loads(request.content)["model"]
+        calls.append(model)
+        if model.startswith("fail"):
+            return httpx.Response(429)
+        content = "PROFESSIONAL SUMMARY\nGreat engineer.\nSHORT USER DESCRIPTION: Jane builds things."
+        return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+    return handle
+
+
+def test_fails_over_to_next_model_without_backoff(monkeypatch):
+    calls = []
+    result, router, sleeps = _run_generate(
+        monkeypatch, [("fail-b", 1), ("good-a", 1)], 1, _handler(calls)
+    )
+    assert calls == ["fail-b", "good-a"]
+    assert sleeps == []
+    assert result["fallback"] is False
+    assert router.models["good-a"].latency is not None
+
+
+def test_backs_off_when_only_one_model_meets_the_tier(monkeypatch):
+    calls = []
+    result, router, sleeps = _run_generate(
+        monkeypatch, [("good-a", 1), ("fail-b", 2), ("fail-c", 1)], 2, _handler(calls)
+    )
+    assert calls == ["fail-b", "fail-b", "fail-b"]
+    assert len(sleeps) == 2 and all(s >= 1 for s in sleeps)
+    assert result["fallback"] is True
+    assert router.models["fail-b"].failures == 3